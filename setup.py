@@ -8,15 +8,12 @@ from pathlib import Path
 this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text()
 
-# Read requirements
-requirements = []
+# Read requirements (raw specifier lines; comments and blanks skipped)
 with open('requirements.txt') as f:
-    for line in f:
-        line = line.strip()
-        if line and not line.startswith('#'):
-            # Extract just the package name, ignoring version specifiers
-            pkg = line.split('>=')[0].split('==')[0].split('<')[0].split('>')[0]
-            requirements.append(line)
+    requirements = [
+        line.strip() for line in f
+        if line.strip() and not line.strip().startswith('#')
+    ]
 
 setup(
     name="db-backup-cli",
@@ -35,15 +32,13 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Topic :: Database",
         "Topic :: System :: Archiving :: Backup",
         "Topic :: Utilities",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "psycopg2-binary>=2.9.0",
         "PyYAML>=6.0",
@@ -1,16 +1,81 @@
 # src/adapters/base.py
+import subprocess
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
-@dataclass
+
+def drain_stderr(proc, keep_lines: int = 200, line_handler=None):
+    """
+    Drain proc.stderr on a background thread into a bounded deque.
+
+    capture_output=True buffers the whole stream in memory and, worse,
+    a full ~64 KiB pipe makes the child block mid-backup. Draining
+    incrementally keeps long-running dumps moving; only the last
+    keep_lines lines are kept for error reporting.
+
+    An optional line_handler is called with each raw line as it streams
+    past, for callers that want to scrape progress output on the fly.
+
+    Returns (thread, tail) - join the thread after the process exits,
+    then format the tail with stderr_tail_text().
+    """
+    tail = deque(maxlen=keep_lines)
+
+    def _drain():
+        for line in proc.stderr:
+            tail.append(line)
+            if line_handler is not None:
+                line_handler(line)
+        proc.stderr.close()
+
+    thread = threading.Thread(target=_drain, daemon=True)
+    thread.start()
+    return thread, tail
+
+
+def stderr_tail_text(tail) -> str:
+    """Decode the stderr tail collected by drain_stderr for error messages"""
+    return b''.join(tail).decode('utf-8', errors='replace')
+
+
+def run_streamed(cmd, stdin=None, env=None) -> Tuple[int, str]:
+    """
+    Run a command, discarding stdout and streaming stderr incrementally.
+
+    Drop-in replacement for subprocess.run(capture_output=True) where
+    stdout is unused. Returns (returncode, tail_of_stderr).
+    """
+    # close_fds=False keeps CPython on the posix_spawn fast path (fork of
+    # a large parent costs tens of ms); PEP 446 makes Python-created fds
+    # non-inheritable anyway, so nothing leaks to the child
+    proc = subprocess.Popen(
+        cmd,
+        stdin=stdin,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=env,
+        close_fds=False
+    )
+    thread, tail = drain_stderr(proc)
+    returncode = proc.wait()
+    thread.join()
+    return returncode, stderr_tail_text(tail)
+
+@dataclass(frozen=True, slots=True)
 class BackupResult:
     """
     A container for backup results.
-    
-    Think of this as a structured way to return multiple pieces of 
+
+    Think of this as a structured way to return multiple pieces of
     information from the backup function instead of just True/False.
+
+    Frozen and slotted: results are immutable records, and slots keep
+    them small and attribute access cheap when manifests aggregate
+    thousands of them.
     """
     success: bool                          # Did it work?
     file_path: str                         # Where is the backup file?
@@ -40,15 +105,52 @@ class DatabaseAdapter(ABC):
     that helps enforce interface contracts.
     """
     
-    def __init__(self, connection_params: Dict[str, Any]):
+    # Resolved once for all adapters the first time a command is wrapped
+    _ionice_path = None
+    _nice_path = None
+    _priority_paths_resolved = False
+
+    def __init__(self, connection_params: Dict[str, Any],
+                 io_priority: Optional[int] = None, nice: Optional[int] = None):
         """
         Initialize the adapter with connection parameters.
-        
+
         Args:
             connection_params: Dictionary containing host, port, user, password, etc.
+            io_priority: Optional ionice best-effort level (0-7) for dump/restore
+                processes, so backups don't starve a host's primary workload
+            nice: Optional CPU niceness (e.g. 10) for the same processes
         """
         self.connection_params = connection_params
         self.connection = None
+        self.io_priority = io_priority
+        self.nice = nice
+        self._params_valid = None  # validate_params() fills this on first use
+
+    def _wrap_cmd(self, cmd: list) -> list:
+        """
+        Prepend nice/ionice to a dump/restore command when priorities are set.
+
+        This doesn't make the backup itself faster - it keeps a shared
+        host's primary workload within its latency budget while the
+        backup saturates disk and CPU. Binaries are resolved once and
+        silently skipped where unavailable (e.g. macOS has no ionice).
+        """
+        if self.io_priority is None and self.nice is None:
+            return cmd
+
+        if not DatabaseAdapter._priority_paths_resolved:
+            import shutil
+            DatabaseAdapter._ionice_path = shutil.which('ionice')
+            DatabaseAdapter._nice_path = shutil.which('nice')
+            DatabaseAdapter._priority_paths_resolved = True
+
+        prefix = []
+        if self.nice is not None and DatabaseAdapter._nice_path:
+            prefix += [DatabaseAdapter._nice_path, '-n', str(self.nice)]
+        if self.io_priority is not None and DatabaseAdapter._ionice_path:
+            prefix += [DatabaseAdapter._ionice_path, '-c2', '-n', str(self.io_priority)]
+        return prefix + cmd
     
     @abstractmethod
     def test_connection(self) -> bool:
@@ -103,10 +205,26 @@ class DatabaseAdapter(ABC):
         """
         pass
     
+    def close(self):
+        """
+        Release any pooled connections held by the adapter.
+
+        Default is a no-op - adapters that keep a live client (e.g.
+        MongoDB) override this so callers can tear them down uniformly.
+        """
+        pass
+
     def validate_params(self) -> bool:
         """
         Validate that required connection parameters are present.
         Not abstract - child classes can use this or override it.
+
+        The result is computed once and cached - connection_params is
+        treated as immutable after __init__ (the URI caching in the
+        adapters already relies on this), so revalidating on every call
+        in a multi-database orchestration is wasted work.
         """
-        required = ['host', 'user', 'password', 'database']
-        return all(param in self.connection_params for param in required)
\ No newline at end of file
+        if self._params_valid is None:
+            required = ['host', 'user', 'password', 'database']
+            self._params_valid = all(param in self.connection_params for param in required)
+        return self._params_valid
\ No newline at end of file
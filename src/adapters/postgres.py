@@ -1,12 +1,24 @@
 # src/adapters/postgres.py
+import logging
+import os
+import re
+from contextlib import contextmanager, nullcontext
+import shutil
 import subprocess
+import tempfile
 import psycopg 
 from psycopg import OperationalError
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
+from functools import cached_property
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
-from .base import DatabaseAdapter, BackupResult
+from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from .base import DatabaseAdapter, BackupResult, drain_stderr, run_streamed, stderr_tail_text
+
+logger = logging.getLogger(__name__)
 
 
 class PostgreSQLAdapter(DatabaseAdapter):
@@ -18,21 +30,102 @@ class PostgreSQLAdapter(DatabaseAdapter):
     2. pg_dump/pg_restore command-line tools for actual backups
     """
     
-    def __init__(self, connection_params):
+    # Matches "TABLE <schema> <table>" (DDL) and "TABLE DATA ..." entries
+    # in pg_restore --list output, anchored on the numeric TOC fields so
+    # descriptions that merely contain the word TABLE don't match;
+    # compiled once at import instead of tokenising every TOC line
+    _TOC_TABLE_RE = re.compile(rb';\s+\d+\s+\d+\s+TABLE(?: DATA)?(?! ATTACH)\s+(\S+)\s+(\S+)')
+
+    def __init__(self, connection_params, verbose: bool = False):
         super().__init__(connection_params)
         if 'port' not in self.connection_params:
             self.connection_params['port'] = 5432
+        # --verbose makes pg_dump/pg_restore print one line per object,
+        # which is pure overhead on multi-thousand-table schemas when
+        # nobody is reading it - off unless a debugging user opts in
+        self.verbose = verbose
     
+    # Homebrew keg-only installs don't put the PostgreSQL 15 tools on PATH
+    _HOMEBREW_BIN = Path('/opt/homebrew/opt/postgresql@15/bin')
+
+    @staticmethod
+    def _resolve_bin(name: str) -> str:
+        """Resolve a PostgreSQL client tool, preferring the Homebrew keg"""
+        homebrew = PostgreSQLAdapter._HOMEBREW_BIN / name
+        if homebrew.exists():
+            return str(homebrew)
+        return shutil.which(name) or name
+
+    @cached_property
+    def _pg_dump(self) -> str:
+        """pg_dump path, resolved once instead of a stat per backup call"""
+        return self._resolve_bin('pg_dump')
+
+    @cached_property
+    def _pg_restore(self) -> str:
+        """pg_restore path, resolved once and shared by the restore/list paths"""
+        return self._resolve_bin('pg_restore')
+
+    @cached_property
+    def _pg_dump_version(self) -> int:
+        """Major version of the pg_dump client, parsed from --version"""
+        try:
+            result = subprocess.run(
+                [self._pg_dump, '--version'],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            match = re.search(r'(\d+)\.', result.stdout)
+            return int(match.group(1)) if match else 0
+        except Exception:
+            return 0
+
+    @cached_property
+    def _conninfo(self) -> str:
+        """
+        Cached psycopg3 connection string.
+
+        make_conninfo quotes values per libpq rules, so passwords with
+        spaces or quotes no longer produce a silently broken string; the
+        result is computed once since connection_params is treated as
+        immutable after __init__.
+        """
+        return make_conninfo(
+            host=self.connection_params['host'],
+            port=self.connection_params['port'],
+            user=self.connection_params['user'],
+            password=self.connection_params['password'],
+            dbname=self.connection_params['database']
+        )
+
     def _get_connection_string(self) -> str:
         """Build PostgreSQL connection string for psycopg3"""
-        return (
-            f"host={self.connection_params['host']} "
-            f"port={self.connection_params['port']} "
-            f"user={self.connection_params['user']} "
-            f"password={self.connection_params['password']} "
-            f"dbname={self.connection_params['database']}"
-        )
+        return self._conninfo
     
+    @cached_property
+    def _pool(self) -> ConnectionPool:
+        """
+        Lazily-created psycopg connection pool for metadata queries.
+
+        test_connection and get_database_size used to open (and TLS/auth
+        handshake) a fresh connection each; the pool pays that cost once
+        per adapter and also caps how many connections a backup
+        orchestration can open against the server.
+        """
+        return ConnectionPool(
+            self._get_connection_string(),
+            min_size=1,
+            max_size=4,
+            timeout=10
+        )
+
+    def close(self):
+        """Close the connection pool, if one was ever created"""
+        if '_pool' in self.__dict__:
+            self._pool.close()
+            del self.__dict__['_pool']
+
     def test_connection(self) -> bool:
         """
         Try to connect to PostgreSQL using psycopg3.
@@ -40,78 +133,113 @@ class PostgreSQLAdapter(DatabaseAdapter):
         This is a quick check before we start a potentially long backup.
         """
         try:
-            # psycopg3 uses a connection string approach
-            conn = psycopg.connect(
-                self._get_connection_string(),
-                connect_timeout=10
-            )
-            
-            # If we got here, connection worked!
-            conn.close()
+            with self._pool.connection() as conn:
+                conn.execute('SELECT 1')
             return True
             
         except OperationalError as e:
-            print(f"❌ Connection error: {e}")
+            logger.error(f"Connection error: {e}")
             return False
         except Exception as e:
-            print(f"❌ Unexpected error: {e}")
+            logger.error(f"Unexpected error: {e}")
             return False
     
-    def backup(self, output_path: str, backup_type: str = "full") -> BackupResult:
+    def backup(self, output_path: str, backup_type: str = "full",
+               format: str = "custom", jobs: Optional[int] = None,
+               compression: Optional[str] = None,
+               file_hook: Optional[Callable[[Path], None]] = None,
+               no_sync: bool = False) -> BackupResult:
         """
         Create a backup using pg_dump.
-        
+
         pg_dump is a command-line utility that comes with PostgreSQL.
         We call it using Python's subprocess module.
+
+        With format="directory", pg_dump writes one file per table into
+        output_path and dumps tables concurrently with --jobs (default:
+        CPU count) - roughly a min(tables, cores) wall-clock speedup on
+        wide schemas. The default stays "custom" because the single-file
+        form is what verification and retention expect.
+
+        compression defaults to zstd level 3 when the pg_dump client is
+        v16+ (zstd is 2-4x faster than the default gzip with a better
+        ratio - dump CPU is usually the compressor), falling back to
+        gzip level 6 for older clients. Pass e.g. "zstd:9" or "0" to
+        override.
+
+        With format="directory", file_hook (if given) is called with each
+        per-table data file as soon as pg_dump finishes writing it - e.g.
+        an object-store upload - so shipping the backup overlaps the dump
+        instead of waiting for it.
+
+        no_sync=True passes --no-sync so pg_dump skips the final fsync of
+        its output - a free saving of seconds to minutes on big dumps,
+        but only safe when the file is uploaded or replicated before
+        anyone trusts it.
         """
-        print(f"🔄 Starting PostgreSQL backup...")
+        logger.info("Starting PostgreSQL backup...")
         start_time = time.time()
-        
+
         # Ensure output directory exists
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Use full path to pg_dump for Homebrew installation
-        pg_dump_path = '/opt/homebrew/opt/postgresql@15/bin/pg_dump'
-        
-        # Check if pg_dump exists at this path
-        if not Path(pg_dump_path).exists():
-            # Fallback to system pg_dump
-            pg_dump_path = 'pg_dump'
-        
+
         # Build the pg_dump command
         cmd = [
-            pg_dump_path,
+            self._pg_dump,
             f"--host={self.connection_params['host']}",
             f"--port={self.connection_params['port']}",
             f"--username={self.connection_params['user']}",
             f"--dbname={self.connection_params['database']}",
-            f"--file={output_path}",
-            '--format=custom',
-            '--verbose',
+            f"--format={format}",
             '--no-password'
         ]
-        
-        # Pass password via environment variable
-        env = {
-            'PGPASSWORD': self.connection_params['password']
-        }
-        
+        if self.verbose:
+            cmd.append('--verbose')
+        if no_sync:
+            cmd.append('--no-sync')
+
+        if compression is None:
+            compression = 'zstd:3' if self._pg_dump_version >= 16 else '6'
+        cmd.append(f"--compress={compression}")
+
+        if format == 'directory':
+            # Directory output can't stream to stdout, and only this
+            # format supports parallel dump workers
+            cmd.append(f"--file={output_path}")
+            cmd.append(f"--jobs={jobs or os.cpu_count()}")
+
+        # Pass the password on top of the parent environment - wiping it
+        # would strip PATH, locale and TMPDIR, and a user-chosen TMPDIR on
+        # fast storage matters when the tools spill to temp files
+        env = {**os.environ, 'PGPASSWORD': self.connection_params['password']}
+
         try:
-            # Run the command
-            result = subprocess.run(
-                cmd,
-                env=env,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
+            if format == 'directory':
+                if file_hook is not None:
+                    returncode, stderr_tail = self._stream_directory_files(
+                        cmd, env, output_file, file_hook
+                    )
+                else:
+                    # --verbose prints a line per object; stream stderr through
+                    # the bounded drain instead of buffering it all in memory
+                    returncode, stderr_tail = run_streamed(self._wrap_cmd(cmd), env=env)
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr_tail)
+                file_size = sum(
+                    p.stat().st_size for p in output_file.rglob('*') if p.is_file()
+                )
+            else:
+                # Stream the archive from pg_dump's stdout straight to the
+                # destination, pumping 1 MiB chunks and counting bytes as
+                # they pass - no --file spool, no post-write stat(), and
+                # the sink could just as well be a remote object store
+                file_size = self._stream_dump_to_file(cmd, env, output_file)
+
             # Calculate metrics
             duration = time.time() - start_time
-            file_size = output_file.stat().st_size
             
-            print(f"✅ Backup completed in {duration:.2f} seconds")
+            logger.info(f"Backup completed in {duration:.2f} seconds")
             
             return BackupResult(
                 success=True,
@@ -124,7 +252,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         except subprocess.CalledProcessError as e:
             duration = time.time() - start_time
             error_msg = f"pg_dump failed: {e.stderr}"
-            print(f"❌ {error_msg}")
+            logger.error(error_msg)
             
             return BackupResult(
                 success=False,
@@ -145,50 +273,193 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 error_message="pg_dump not found. Is PostgreSQL installed?"
             )
     
-    def restore(self, backup_path: str, target_db: Optional[str] = None) -> bool:
+    def _stream_directory_files(self, cmd: list, env: dict, dump_dir: Path,
+                                file_hook: Callable[[Path], None]):
+        """
+        Run a directory-format dump, feeding finished data files to file_hook.
+
+        pg_dump gives no per-file completion signal, so the watcher polls
+        the dump directory and treats a data file as done once its size
+        has held steady for a full poll interval and it hasn't been
+        touched for a second; anything still pending is dispatched after
+        pg_dump exits. Hooks run on a small thread pool so slow sinks
+        overlap the ongoing dump. Returns (returncode, stderr_tail).
+        """
+        proc = subprocess.Popen(
+            self._wrap_cmd(cmd),
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False
+        )
+        drain_thread, stderr_tail = drain_stderr(proc)
+
+        dispatched = {}
+        last_sizes = {}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            while True:
+                finished = proc.poll() is not None
+                if dump_dir.exists():
+                    for path in dump_dir.glob('*.dat*'):
+                        if path in dispatched:
+                            continue
+                        stat = path.stat()
+                        stable = (last_sizes.get(path) == stat.st_size
+                                  and time.time() - stat.st_mtime > 1.0)
+                        if finished or stable:
+                            dispatched[path] = pool.submit(file_hook, path)
+                        else:
+                            last_sizes[path] = stat.st_size
+                if finished:
+                    break
+                time.sleep(0.5)
+            # the with-block drains outstanding hook calls
+        returncode = proc.wait()
+        drain_thread.join()
+        for path, future in dispatched.items():
+            error = future.exception()
+            if error is not None:
+                logger.error(f"file_hook failed for {path}: {error}")
+        return returncode, stderr_tail_text(stderr_tail)
+
+    def _stream_dump_to_file(self, cmd: list, env: dict, output_file: Path) -> int:
+        """
+        Pump pg_dump's stdout into output_file, returning the byte count.
+
+        Raises CalledProcessError (with the stderr tail attached) if
+        pg_dump exits non-zero; a truncated archive is removed.
+        """
+        # close_fds=False keeps the spawn on posix_spawn; see base.run_streamed
+        proc = subprocess.Popen(
+            self._wrap_cmd(cmd),
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False
+        )
+        drain_thread, stderr_tail = drain_stderr(proc)
+
+        file_size = 0
+        with open(output_file, 'wb') as out:
+            while True:
+                chunk = proc.stdout.read(1 << 20)
+                if not chunk:
+                    break
+                out.write(chunk)
+                file_size += len(chunk)
+        proc.stdout.close()
+
+        returncode = proc.wait()
+        drain_thread.join()
+        if returncode != 0:
+            if output_file.exists():
+                output_file.unlink()
+            raise subprocess.CalledProcessError(
+                returncode, cmd, stderr=stderr_tail_text(stderr_tail)
+            )
+        return file_size
+
+    # Bulk-load settings applied around a tuned restore. All are
+    # reloadable (no server restart) and are reset again afterwards.
+    _RESTORE_TUNING = (
+        ('maintenance_work_mem', "'1GB'"),
+        ('max_parallel_maintenance_workers', '4'),
+        ('synchronous_commit', 'off'),
+    )
+
+    @contextmanager
+    def _tuned_for_restore(self):
+        """
+        Temporarily apply bulk-restore server settings via ALTER SYSTEM.
+
+        Session-level SET wouldn't help here because pg_restore opens its
+        own connections, so the values are set system-wide, the config
+        reloaded, and everything reset in the finally even if the restore
+        fails. Requires superuser; settings that can't be applied are
+        logged and skipped.
+        """
+        applied = []
+        try:
+            with self._pool.connection() as conn:
+                conn.autocommit = True  # ALTER SYSTEM refuses transactions
+                for name, value in self._RESTORE_TUNING:
+                    try:
+                        conn.execute(f"ALTER SYSTEM SET {name} = {value}")
+                        applied.append(name)
+                    except Exception as e:
+                        logger.warning(f"Could not set {name} for restore: {e}")
+                if applied:
+                    conn.execute("SELECT pg_reload_conf()")
+            yield
+        finally:
+            if applied:
+                try:
+                    with self._pool.connection() as conn:
+                        conn.autocommit = True
+                        for name in applied:
+                            conn.execute(f"ALTER SYSTEM RESET {name}")
+                        conn.execute("SELECT pg_reload_conf()")
+                except Exception as e:
+                    logger.warning(f"Could not reset restore tuning: {e}")
+
+    def restore(self, backup_path: str, target_db: Optional[str] = None,
+                jobs: Optional[int] = None, tune: bool = False) -> bool:
         """
         Restore a database from backup using pg_restore.
-        
+
         WARNING: This will overwrite the existing database!
+
+        jobs (default: CPU count) loads table data and builds indexes in
+        parallel workers - typically a multiple-times-faster restore on
+        multi-core hosts. Note pg_restore refuses --jobs together with
+        --single-transaction, so parallel restores are not atomic; on the
+        server side, a generous maintenance_work_mem is what lets the
+        parallel index builds actually bite.
+
+        tune=True wraps the restore in _tuned_for_restore, which lifts
+        maintenance_work_mem, parallel maintenance workers and
+        synchronous_commit for the duration - the index-build phase is
+        usually the restore bottleneck, and defaults are pessimal for it.
         """
-        if not Path(backup_path).exists():
-            print(f"❌ Backup file not found: {backup_path}")
+        try:
+            # EAFP: one stat via the exception path, and no window where
+            # the file can vanish between a check and the spawn below
+            os.stat(backup_path)
+        except FileNotFoundError:
+            logger.error(f"Backup file not found: {backup_path}")
             return False
         
         db_name = target_db or self.connection_params['database']
         
-        print(f"🔄 Restoring to database '{db_name}'...")
-        print("⚠️  This will overwrite existing data!")
-        
-        # Use full path to pg_restore (same as pg_dump)
-        pg_restore_path = '/opt/homebrew/opt/postgresql@15/bin/pg_restore'
-        
-        # Check if pg_restore exists at this path
-        if not Path(pg_restore_path).exists():
-            # Fallback to system pg_restore
-            pg_restore_path = 'pg_restore'
+        logger.info(f"Restoring to database '{db_name}'...")
+        logger.warning("This will overwrite existing data!")
         
         cmd = [
-            pg_restore_path,
+            self._pg_restore,
             f"--host={self.connection_params['host']}",
             f"--port={self.connection_params['port']}",
             f"--username={self.connection_params['user']}",
             f"--dbname={db_name}",
-            '--verbose',
             '--clean',
             '--if-exists',
-            backup_path
+            f"--jobs={jobs or os.cpu_count()}",
         ]
+        if self.verbose:
+            cmd.append('--verbose')
+        cmd.append(backup_path)
         
-        env = {'PGPASSWORD': self.connection_params['password']}
-        
+        env = {**os.environ, 'PGPASSWORD': self.connection_params['password']}
+
         try:
-            subprocess.run(cmd, env=env, check=True, capture_output=True, text=True)
-            print(f"✅ Database restored successfully!")
+            with self._tuned_for_restore() if tune else nullcontext():
+                returncode, stderr_tail = run_streamed(self._wrap_cmd(cmd), env=env)
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr_tail)
+            logger.info("Database restored successfully!")
             return True
-            
+
         except subprocess.CalledProcessError as e:
-            print(f"❌ Restore failed: {e.stderr}")
+            logger.error(f"Restore failed: {e.stderr}")
             return False
     
     def get_database_size(self) -> int:
@@ -196,120 +467,270 @@ class PostgreSQLAdapter(DatabaseAdapter):
         Query PostgreSQL for the database size using psycopg3.
         """
         try:
-            # psycopg3 connection
-            conn = psycopg.connect(self._get_connection_string())
-            
-            # Execute query - psycopg3 uses context managers
-            with conn.cursor() as cursor:
-                query = f"SELECT pg_database_size('{self.connection_params['database']}')"
-                cursor.execute(query)
+            # Reuse a pooled connection - psycopg3 uses context managers.
+            # Parameterised so the server can cache the plan (psycopg
+            # auto-prepares repeated statements) and nothing can be
+            # injected through the database name.
+            with self._pool.connection() as conn, conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_database_size(%s)",
+                    (self.connection_params['database'],)
+                )
                 size = cursor.fetchone()[0]
             
-            conn.close()
             return size
             
         except Exception as e:
-            print(f"❌ Could not get database size: {e}")
+            logger.error(f"Could not get database size: {e}")
             return 0
         
 
-    def restore_selective(self, backup_path: str, target_db: str, tables: list) -> bool:
+    def restore_selective(self, backup_path: str, target_db: str, tables: list,
+                          jobs: Optional[int] = None) -> bool:
         """
         Restore specific tables from backup using pg_restore.
-        
+
         Args:
             backup_path: Path to backup file
             target_db: Target database name
             tables: List of table names to restore
-        
+            jobs: Parallel restore workers (default: CPU count); see restore()
+
         Returns:
             True if successful, False otherwise
         """
-        if not Path(backup_path).exists():
-            print(f"Backup file not found: {backup_path}")
+        try:
+            # EAFP: one stat via the exception path, and no window where
+            # the file can vanish between a check and the spawn below
+            os.stat(backup_path)
+        except FileNotFoundError:
+            logger.error(f"Backup file not found: {backup_path}")
             return False
         
-        print(f"Restoring tables: {', '.join(tables)} to database '{target_db}'...")
-        print("This will overwrite existing data in these tables!")
+        logger.info(f"Restoring tables: {', '.join(tables)} to database '{target_db}'...")
+        logger.warning("This will overwrite existing data in these tables!")
         
-        pg_restore_path = '/opt/homebrew/opt/postgresql@15/bin/pg_restore'
-        
-        if not Path(pg_restore_path).exists():
-            pg_restore_path = 'pg_restore'
-        
-        # Build command with table selections
+        # Instead of one --table flag per table (which makes pg_restore
+        # re-filter the TOC for each flag and can blow past OS argv
+        # limits), read the TOC once, keep only the entries we want, and
+        # hand pg_restore a precomputed --use-list file
+        toc_lines = self._toc_entries_for(backup_path, tables)
+        if toc_lines is None:
+            return False
+        if not toc_lines:
+            logger.error("None of the requested tables were found in the backup")
+            return False
+
         cmd = [
-            pg_restore_path,
+            self._pg_restore,
             f"--host={self.connection_params['host']}",
             f"--port={self.connection_params['port']}",
             f"--username={self.connection_params['user']}",
             f"--dbname={target_db}",
-            '--verbose',
             '--clean',
             '--if-exists',
+            f"--jobs={jobs or os.cpu_count()}",
         ]
-        
-        # Add each table
-        for table in tables:
-            cmd.extend(['--table', table])
-        
-        cmd.append(backup_path)
-        
-        env = {'PGPASSWORD': self.connection_params['password']}
-        
+        if self.verbose:
+            cmd.append('--verbose')
+
+        env = {**os.environ, 'PGPASSWORD': self.connection_params['password']}
+
+        toc_file = tempfile.NamedTemporaryFile(mode='wb', suffix='.toc', delete=False)
         try:
-            subprocess.run(cmd, env=env, check=True, capture_output=True, text=True)
-            print(f"Tables restored successfully!")
+            toc_file.writelines(toc_lines)
+            toc_file.close()
+            cmd.append(f"--use-list={toc_file.name}")
+            cmd.append(backup_path)
+
+            returncode, stderr_tail = run_streamed(self._wrap_cmd(cmd), env=env)
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr_tail)
+            logger.info("Tables restored successfully!")
             return True
-            
+
         except subprocess.CalledProcessError as e:
-            print(f"Restore failed: {e.stderr}")
+            logger.error(f"Restore failed: {e.stderr}")
             return False
+        finally:
+            os.unlink(toc_file.name)
 
+    def _toc_entries_for(self, backup_path: str, tables: list) -> Optional[list]:
+        """
+        Collect the raw TOC lines for the given tables from pg_restore -l.
+
+        Keeps both the TABLE (definition) and TABLE DATA entries, so a
+        selective restore with --clean --if-exists recreates each table
+        before loading its rows - matching what --table used to do.
+        Returns the matching lines (bytes), or None if listing the TOC
+        failed. The lines are written verbatim to a --use-list file so
+        pg_restore streams the archive once with the filter precomputed.
+        """
+        wanted = set(tables)
+        toc_lines = []
+        cmd = [self._pg_restore, '--list', backup_path]
+
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1 << 20,
+                close_fds=False
+            )
+            drain_thread, stderr_tail = drain_stderr(proc)
+            for line in proc.stdout:
+                match = self._TOC_TABLE_RE.search(line)
+                if match and match.group(2).decode() in wanted:
+                    toc_lines.append(line)
+            proc.stdout.close()
+
+            returncode = proc.wait()
+            drain_thread.join()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(
+                    returncode, cmd, stderr=stderr_tail_text(stderr_tail)
+                )
+
+            return toc_lines
+
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to read backup TOC: {e.stderr}")
+            return None
+
+
+    def _list_tables_from_archive(self, backup_path: str) -> Optional[list]:
+        """
+        Read the table list straight out of a custom-format archive's TOC.
+
+        The binary TOC sits at the head of the file, so this touches only
+        the first few KB and skips the pg_restore fork entirely. Returns
+        None when the file isn't a custom archive we know how to parse
+        (directory format, or an archive version outside 1.12-1.16) so
+        the caller can fall back to pg_restore --list.
+        """
+        with open(backup_path, 'rb') as f:
+            def read_exact(n: int) -> bytes:
+                data = f.read(n)
+                if len(data) != n:
+                    raise ValueError("truncated archive TOC")
+                return data
+
+            def read_int() -> int:
+                sign = read_exact(1)[0]
+                value = int.from_bytes(read_exact(int_size), 'little')
+                return -value if sign else value
+
+            def read_str() -> Optional[bytes]:
+                length = read_int()
+                return None if length < 0 else read_exact(length)
+
+            if f.read(5) != b'PGDMP':
+                return None
+            vmaj, vmin, _vrev, int_size, off_size, fmt = read_exact(6)
+            version = (vmaj, vmin)
+            if fmt != 1 or not ((1, 12) <= version <= (1, 16)):
+                # Not a custom archive, or a TOC layout we haven't verified
+                return None
+
+            # Remainder of the header
+            if version >= (1, 15):
+                read_exact(1)  # compression algorithm byte
+            else:
+                read_int()  # compression level
+            for _ in range(7):
+                read_int()  # creation time fields
+            read_str()  # database name
+            read_str()  # server version
+            read_str()  # pg_dump version
+
+            tables = {}
+            for _ in range(read_int()):  # TOC entry count
+                read_int()  # dump id
+                read_int()  # has data dumper
+                read_str()  # table oid
+                read_str()  # oid
+                tag = read_str()
+                desc = read_str()
+                read_int()  # section
+                read_str()  # definition
+                read_str()  # drop statement
+                read_str()  # copy statement
+                namespace = read_str()
+                read_str()  # tablespace
+                if version >= (1, 14):
+                    read_str()  # table access method
+                if version >= (1, 16):
+                    read_int()  # relkind
+                read_str()  # owner
+                read_str()  # legacy with-oids flag
+                while read_str() is not None:  # dependency ids
+                    pass
+                read_exact(1 + off_size)  # data offset within the archive
+                if desc == b'TABLE DATA' and namespace == b'public':
+                    tables[tag.decode()] = None
+            return list(tables)
 
     def list_tables_in_backup(self, backup_path: str) -> list:
         """
         List all tables available in a backup file.
-        
+
         Args:
             backup_path: Path to backup file
-        
+
         Returns:
             List of table names
         """
-        if not Path(backup_path).exists():
-            print(f"Backup file not found: {backup_path}")
+        try:
+            os.stat(backup_path)
+        except FileNotFoundError:
+            logger.error(f"Backup file not found: {backup_path}")
             return []
-        
-        pg_restore_path = '/opt/homebrew/opt/postgresql@15/bin/pg_restore'
-        
-        if not Path(pg_restore_path).exists():
-            pg_restore_path = 'pg_restore'
-        
+
+        # Fast path: read the binary TOC ourselves - no subprocess, and
+        # only the head of the file is touched. Any parse surprise falls
+        # back to asking pg_restore.
+        try:
+            tables = self._list_tables_from_archive(backup_path)
+            if tables is not None:
+                return tables
+        except Exception:
+            pass
+
         cmd = [
-            pg_restore_path,
+            self._pg_restore,
             '--list',
             backup_path
         ]
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            
-            # Parse the output to extract table names
-            tables = []
-            for line in result.stdout.split('\n'):
-                # Look for lines that contain "TABLE DATA"
-                if 'TABLE DATA' in line:
-                    # Extract table name
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if part == 'public' and i + 1 < len(parts):
-                            table_name = parts[i + 1]
-                            if table_name not in tables:
-                                tables.append(table_name)
-            
-            return tables
-            
+            # The TOC of a TB-scale archive can run to many MB; stream it
+            # line by line so peak memory stays at one line, not the whole
+            # listing. dict preserves TOC order while deduping.
+            tables = {}
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1 << 20,
+                close_fds=False
+            )
+            drain_thread, stderr_tail = drain_stderr(proc)
+            for line in proc.stdout:
+                match = self._TOC_TABLE_RE.search(line)
+                if match and match.group(1) == b'public':
+                    tables[match.group(2).decode()] = None
+            proc.stdout.close()
+
+            returncode = proc.wait()
+            drain_thread.join()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(
+                    returncode, cmd, stderr=stderr_tail_text(stderr_tail)
+                )
+
+            return list(tables)
+
         except subprocess.CalledProcessError as e:
-            print(f"Failed to list tables: {e.stderr}")
+            logger.error(f"Failed to list tables: {e.stderr}")
             return []
\ No newline at end of file
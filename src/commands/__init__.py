@@ -0,0 +1 @@
+# Command modules are imported lazily by the CLI group; see cli.LazyGroup
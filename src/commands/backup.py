@@ -0,0 +1,275 @@
+import threading
+import click
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from ..cli import (_config, _backup_dir, _resolve_params, _RESOLVE_KEYS,
+                   _make_adapter, _logger, _slack_notifier, _verifier,
+                   _metadata_store, _notify_async, _join_notifications,
+                   _ensure_connected, _ensure_dir, _EXT)
+
+
+@click.command()
+@click.option('--db-type', 
+              type=click.Choice(['postgres','mysql','mongodb'], case_sensitive=False),
+              default=None,
+              help='Type of database (default: from .env)')
+@click.option('--host', 
+              default=None,
+              help='Database host (default: from .env)')
+@click.option('--port', 
+              type=int,
+              default=None,
+              help='Database port (default: from .env)')
+@click.option('--user', 
+              default=None,
+              help='Database username (default: from .env)')
+@click.option('--password', 
+              default=None,
+              help='Database password (default: from .env)')
+@click.option('--database', 
+              default=None,
+              help='Database name (default: from .env)')
+@click.option('--output', 
+              type=click.Path(path_type=Path),
+              default=None,
+              help='Output file path')
+@click.option('--backup-type',
+              type=click.Choice(['full', 'incremental', 'differential']),
+              default='full',
+              help='Type of backup')
+@click.option('--output-dir',
+              type=click.Path(path_type=Path),
+              default=None,
+              help='Directory to store backups (default: from .env)')
+@click.option('--verify/--no-verify',
+              default=True,
+              help='Verify the backup after it completes')
+@click.option('--jobs', '-j',
+              type=int,
+              default=None,
+              help='Parallel dump jobs (postgres only; switches to directory-format output)')
+@click.option('--show-size/--no-show-size',
+              default=True,
+              help='Query and display the database size before backing up')
+def backup(db_type, host, port, user, password, database, output, backup_type, output_dir, verify, jobs, show_size):
+    """Backup a database"""
+    
+    # Load config from .env
+    config = _config(db_type)
+    backup_dir = _backup_dir()
+    
+    # Use CLI arguments if provided, otherwise use config
+    resolved = _resolve_params(
+        {'type': db_type, 'host': host, 'port': port, 'user': user,
+         'password': password, 'database': database},
+        config
+    )
+    if resolved is None:
+        raise click.ClickException("Missing required parameters!")
+    db_type, host, port, user, password, database = (
+        resolved[key] for key in _RESOLVE_KEYS
+    )
+    output_dir = output_dir or backup_dir
+    
+    # pg_dump only parallelises with the directory format, which writes
+    # a tree instead of a single file - filename, verification and
+    # retention all need to know
+    directory_format = bool(db_type == 'postgres' and jobs and jobs > 1)
+    
+    # Log backup start
+    _logger().log_backup_start(database, db_type, host)
+    
+    # Auto-generate output filename if not provided
+    if output is None:
+        # f-string over the datetime fields skips strftime's locale path
+        now = datetime.now()
+        timestamp = (f"{now.year:04d}{now.month:02d}{now.day:02d}"
+                     f"_{now.hour:02d}{now.minute:02d}{now.second:02d}")
+        # Different extensions for different databases; directory-format
+        # dumps get a bare name - the output is a directory, not a file
+        extension = '' if directory_format else _EXT.get(db_type, '.dump')
+        
+        filename = f"{database}_{db_type}_backup_{timestamp}{extension}"
+        # The CLI option arrives as a Path already; the config fallback
+        # is still a plain string
+        if not isinstance(output_dir, Path):
+            output_dir = Path(output_dir)
+        output = output_dir / filename
+
+        _ensure_dir(output_dir)
+        click.echo(f"Auto-generated filename: {output}\n")
+        
+    # Display what we're about to do - one echo per banner keeps it to
+    # a single stdout write instead of a dozen
+    bar = "=" * 60
+    click.echo("\n".join([
+        bar,
+        "DATABASE BACKUP TOOL",
+        bar,
+        f"Database Type: {db_type.upper()}",
+        f"Host:          {host}",
+        f"Port:          {port or '(default)'}",
+        f"User:          {user}",
+        f"Database:      {database}",
+        f"Output:        {output}",
+        f"Backup Type:   {backup_type}",
+        bar + "\n",
+    ]))
+    
+    # One dict construction; the conditional spread avoids mutating in a
+    # second step when no port was resolved
+    connection_params = {
+        'host': host,
+        'user': user,
+        'password': password,
+        'database': database,
+        **({'port': port} if port else {})
+    }
+    
+    adapter = _make_adapter(db_type, connection_params)
+    if adapter is None:
+        raise click.ClickException(f"Unsupported database type: {db_type}")
+    
+    if show_size:
+        # The size query is a network round-trip of its own; running it
+        # on a worker thread overlaps it with the connection test
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            size_future = pool.submit(adapter.get_database_size)
+            _ensure_connected(adapter, database, host=host, op='backup')
+            click.echo("Checking database size...")
+            db_size = size_future.result()
+    else:
+        # Cron-style runs don't need the cosmetic size echo; skipping
+        # it saves the round-trip entirely
+        _ensure_connected(adapter, database, host=host, op='backup')
+        db_size = 0
+
+    if db_size > 0:
+        # Only compute the unit actually displayed
+        size_gb = db_size / 1073741824
+        if size_gb >= 1:
+            click.echo(f"   Database size: {size_gb:.2f} GB")
+        else:
+            click.echo(f"   Database size: {db_size / 1048576:.2f} MB")
+    click.echo()
+    
+    # Perform backup
+    click.echo("Starting backup operation...")
+    if directory_format:
+        # On multi-core hosts this is the main throughput lever
+        result = adapter.backup(str(output), backup_type, format='directory', jobs=jobs)
+    else:
+        result = adapter.backup(str(output), backup_type)
+    
+    # Show results
+    click.echo()
+    if result.success:
+        # Calculate compression ratio
+        compression_ratio = None
+        if db_size > 0 and result.size_bytes > 0:
+            compression_ratio = db_size / result.size_bytes
+        
+        # Computed once, reused by the log, Slack and banner lines
+        backup_size_mb = result.size_mb()
+
+        # Kick verification off in the background - the SHA256 pass over
+        # a multi-GB dump then overlaps the logger/Slack/metadata IO
+        # below instead of serialising in front of it
+        verification_results = {}
+        verify_thread = None
+        if verify and directory_format:
+            # The verifier hashes and format-checks single files; a
+            # directory-format dump is a tree, so there is nothing for
+            # it to do - pg_restore --list on the directory is the
+            # manual equivalent
+            click.echo("Skipping verification: not supported for directory-format backups")
+        elif verify:
+            click.echo("Verifying backup in the background...")
+            verify_thread = threading.Thread(
+                target=lambda: verification_results.update(
+                    _verifier().verify_full(result.file_path, db_type)
+                ),
+                daemon=True
+            )
+            verify_thread.start()
+
+        # Log success
+        _logger().log_backup_success(
+            database, 
+            result.file_path, 
+            backup_size_mb, 
+            result.duration_seconds,
+            compression_ratio
+        )
+        _notify_async(
+            _slack_notifier().send_backup_success,
+            database,
+            result.file_path,
+            backup_size_mb,
+            result.duration_seconds,
+            compression_ratio
+        )
+
+        # Save metadata
+        _metadata_store().add_backup_record({
+            "timestamp": result.timestamp.isoformat(),
+            "database": database,
+            "db_type": db_type,
+            "host": host,
+            "file_path": result.file_path,
+            "size_bytes": result.size_bytes,
+            "duration_seconds": result.duration_seconds,
+            "compression_ratio": compression_ratio,
+            "backup_type": backup_type,
+            "success": True
+        })
+
+        if verify_thread is not None:
+            verify_thread.join()
+            if verification_results.get('overall_status') == 'PASSED':
+                click.echo("Backup verification: PASSED")
+            else:
+                click.echo(
+                    f"Warning: Backup verification FAILED - {verification_results.get('summary')}",
+                    err=True
+                )
+
+        lines = [
+            bar,
+            "BACKUP COMPLETED SUCCESSFULLY!",
+            bar,
+            f"File:     {result.file_path}",
+            f"Size:     {backup_size_mb:.2f} MB",
+        ]
+        if compression_ratio:
+            lines.append(f"Compression: {compression_ratio:.1f}x (saved {(1 - 1/compression_ratio)*100:.1f}%)")
+        lines.append(f"Duration: {result.duration_seconds:.2f} seconds")
+        lines.append(f"Time:     {result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(bar)
+        click.echo("\n".join(lines))
+        _join_notifications()
+    else:
+        # Log failure
+        _logger().log_backup_failure(database, result.error_message)
+        _notify_async(_slack_notifier().send_backup_failure, database, result.error_message)
+
+        # Save metadata
+        _metadata_store().add_backup_record({
+            "timestamp": result.timestamp.isoformat(),
+            "database": database,
+            "db_type": db_type,
+            "host": host,
+            "error": result.error_message,
+            "success": False
+        })
+        
+        click.echo("\n".join([
+            bar,
+            "BACKUP FAILED!",
+            bar,
+            f"Error: {result.error_message}",
+            bar,
+        ]))
+        _join_notifications()
+        raise click.exceptions.Exit(1)
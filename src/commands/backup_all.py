@@ -0,0 +1,220 @@
+import threading
+import click
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from ..cli import (_config, _backup_dir, _make_adapter, _slack_notifier,
+                   _verifier, _STYLED_SUCCESS, _STYLED_FAILED, _EXT,
+                   _ensure_dir)
+
+
+# Keeps progress lines from interleaving when backups run concurrently
+_echo_lock = threading.Lock()
+
+_TS_FMT = '%Y%m%d_%H%M%S'
+
+
+def _echo_locked(message):
+    with _echo_lock:
+        click.echo(message)
+
+
+def _backup_one(db_type, timestamp, verify_pool):
+    """
+    Back up one configured database and return its summary dict.
+
+    Runs on a worker thread - all output goes through _echo_locked.
+    """
+    config = _config(db_type)
+
+    if not all([config.get('host'), config.get('user'), config.get('password'), config.get('database')]):
+        _echo_locked(f"  Skipping {db_type}: Missing configuration")
+        return {
+            'db_type': db_type,
+            'success': False,
+            'error': 'Missing configuration'
+        }
+
+    extension = _EXT.get(db_type, '.dump')
+
+    filename = f"{config['database']}_{db_type}_backup_{timestamp}{extension}"
+    _ensure_dir(_backup_dir())
+    output = Path(_backup_dir()) / filename
+
+    connection_params = {
+        'host': config['host'],
+        'user': config['user'],
+        'password': config['password'],
+        'database': config['database'],
+        **({'port': config['port']} if config.get('port') else {})
+    }
+
+    try:
+        adapter = _make_adapter(db_type, connection_params)
+        if adapter is None:
+            return {'db_type': db_type, 'success': False, 'error': 'Unsupported type'}
+
+        if not adapter.test_connection():
+            _echo_locked(f"  {db_type}: Connection failed")
+            return {'db_type': db_type, 'success': False, 'error': 'Connection failed'}
+
+        result = adapter.backup(str(output), 'full')
+
+        if result.success:
+            _echo_locked(f"  {db_type}: Success: {result.size_mb():.2f}MB in {result.duration_seconds:.1f}s")
+        else:
+            _echo_locked(f"  {db_type}: Failed: {result.error_message}")
+
+        # Verification is disk/CPU-bound and independent of the other
+        # backups - queue it and let the summary collect the outcome
+        verify_future = None
+        if result.success:
+            verify_future = verify_pool.submit(_verifier().verify_full, str(output), db_type)
+
+        return {
+            'db_type': db_type,
+            'success': result.success,
+            'file': result.file_path if result.success else None,
+            'size_mb': result.size_mb() if result.success else 0,
+            'duration': result.duration_seconds,
+            'verify_future': verify_future,
+            'error': result.error_message if not result.success else None
+        }
+
+    except Exception as e:
+        _echo_locked(f"  {db_type}: Error: {e}")
+        return {'db_type': db_type, 'success': False, 'error': str(e)}
+
+
+@click.command()
+@click.option('--databases',
+              default='postgres,mysql,mongodb',
+              help='Comma-separated list of databases to backup')
+@click.option('--apply-retention',
+              is_flag=True,
+              help='Apply retention policy after backups')
+@click.option('--keep-daily',
+              default=7,
+              help='Number of daily backups to keep')
+@click.option('--keep-weekly',
+              default=4,
+              help='Number of weekly backups to keep')
+@click.option('--keep-monthly',
+              default=12,
+              help='Number of monthly backups to keep')
+def backup_all(databases, apply_retention, keep_daily, keep_weekly, keep_monthly):
+    """
+    Backup all configured databases and send summary
+    
+    Example: python3 -m src.cli backup-all
+    Example: python3 -m src.cli backup-all --apply-retention
+    """
+    from ..retention import RetentionPolicy
+    
+    db_list = [db.strip() for db in databases.split(',')]
+    
+    click.echo("=" * 60)
+    click.echo("BACKUP ALL DATABASES")
+    click.echo("=" * 60)
+    click.echo(f"\nBacking up: {', '.join(db_list)}...")
+    
+    # One clock read serves every filename and the Slack summary - it
+    # also keeps a run's filenames from straddling a second boundary
+    now = datetime.now()
+    timestamp = now.strftime(_TS_FMT)
+    
+    # Each backup spends nearly all its time waiting on an external dump
+    # process, so running them concurrently brings wall-clock down to
+    # roughly the slowest database instead of the sum
+    results_by_type = {}
+    with ThreadPoolExecutor(max_workers=len(db_list)) as executor, \
+            ThreadPoolExecutor(max_workers=1) as verify_pool:
+        futures = {
+            executor.submit(_backup_one, db_type, timestamp, verify_pool): db_type
+            for db_type in db_list
+        }
+        for future in as_completed(futures):
+            results_by_type[futures[future]] = future.result()
+
+        # Resolve queued verifications before the pools shut down
+        for entry in results_by_type.values():
+            verify_future = entry.pop('verify_future', None)
+            entry['verified'] = (
+                verify_future.result()['overall_status'] == 'PASSED'
+                if verify_future is not None else False
+            )
+
+    # Report in the order the databases were requested, not completion order
+    results = [results_by_type[db_type] for db_type in db_list]
+    
+    # Apply retention policy if requested
+    retention_result = None
+    if apply_retention:
+        click.echo("\nApplying retention policy...")
+        policy = RetentionPolicy()
+        retention_result = policy.apply_policy(keep_daily, keep_weekly, keep_monthly)
+        click.echo(f"  Deleted {retention_result['files_deleted']} old backups")
+        click.echo(f"  Freed {retention_result['space_freed_mb']:.2f}MB")
+    
+    # Send summary to Slack
+    slack = _slack_notifier()
+    
+    # One pass both counts successes and renders the per-database detail
+    success_count = 0
+    detail_fields = []
+    for r in results:
+        if r['success']:
+            success_count += 1
+            verified = "✓ verified" if r.get('verified') else ""
+            value = f"{r['size_mb']:.2f}MB in {r['duration']:.1f}s {verified}"
+        else:
+            value = f"Error: {r['error']}"
+        
+        detail_fields.append({
+            "title": r['db_type'].upper(),
+            "value": value,
+            "short": False
+        })
+    failure_count = len(results) - success_count
+    
+    fields = [
+        {"title": "Total Backups", "value": str(len(results)), "short": True},
+        {"title": "Successful", "value": str(success_count), "short": True},
+        {"title": "Failed", "value": str(failure_count), "short": True},
+        {"title": "Timestamp", "value": now.strftime("%Y-%m-%d %H:%M:%S"), "short": False},
+        *detail_fields,
+    ]
+    
+    # Add retention info if applied
+    if retention_result:
+        fields.append({
+            "title": "Retention Policy",
+            "value": f"Deleted {retention_result['files_deleted']} files, freed {retention_result['space_freed_mb']:.2f}MB",
+            "short": False
+        })
+    
+    message = {
+        "attachments": [{
+            "color": "good" if failure_count == 0 else "warning",
+            "title": "Scheduled Backup Summary",
+            "fields": fields,
+            "footer": "Automated Backup System"
+        }]
+    }
+    
+    if slack.enabled:
+        slack._send(message)
+    
+    # Print summary
+    click.echo("\n" + "=" * 60)
+    click.echo("BACKUP SUMMARY")
+    click.echo("=" * 60)
+    click.echo(f"Total: {len(results)} | Success: {success_count} | Failed: {failure_count}")
+    for r in results:
+        status = _STYLED_SUCCESS if r['success'] else _STYLED_FAILED
+        click.echo(f"{r['db_type']:10} - {status}")
+    click.echo("=" * 60)
+    
+    # Exit with error if any failed
+    if failure_count > 0:
+        raise click.exceptions.Exit(1)
@@ -0,0 +1,39 @@
+import click
+
+
+@click.command()
+@click.option('--keep-daily', default=7, help='Daily backups to keep')
+@click.option('--keep-weekly', default=4, help='Weekly backups to keep')
+@click.option('--keep-monthly', default=12, help='Monthly backups to keep')
+@click.option('--dry-run', is_flag=True, help='Show what would be deleted without deleting')
+def cleanup(keep_daily, keep_weekly, keep_monthly, dry_run):
+    """
+    Clean up old backups based on retention policy
+    
+    Example: python3 -m src.cli cleanup --dry-run
+    """
+    from ..retention import RetentionPolicy
+    
+    policy = RetentionPolicy()
+    
+    if dry_run:
+        click.echo("DRY RUN - No files will be deleted")
+    
+    click.echo("\nApplying retention policy...")
+    click.echo(f"Keep: {keep_daily} daily, {keep_weekly} weekly, {keep_monthly} monthly")
+    
+    result = policy.apply_policy(keep_daily, keep_weekly, keep_monthly, dry_run)
+    
+    click.echo("\n" + "=" * 60)
+    click.echo("RETENTION POLICY RESULTS")
+    click.echo("=" * 60)
+    click.echo(f"Files checked:  {result['files_checked']}")
+    click.echo(f"Files kept:     {result['files_kept']}")
+    click.echo(f"Files deleted:  {result['files_deleted']}")
+    click.echo(f"Space freed:    {result['space_freed_mb']:.2f}MB")
+    click.echo("=" * 60)
+    
+    if result['deleted_files']:
+        click.echo("\nDeleted files:")
+        for f in result['deleted_files']:
+            click.echo(f"  - {f}")
@@ -0,0 +1,53 @@
+import click
+from itertools import chain
+from ..cli import _metadata_store, _STYLED_SUCCESS, _STYLED_FAILED
+
+
+def _format_history_record(backup):
+    """Render one backup history record as a text block"""
+    # Bind each field once - the repeated backup.get() hash lookups add
+    # up over long --limit listings
+    get = backup.get
+    success = get("success")
+    status = _STYLED_SUCCESS if success else _STYLED_FAILED
+
+    lines = [
+        f"\nTimestamp: {get('timestamp')}",
+        f"Database:  {get('database')}",
+        f"Status:    {status}",
+    ]
+    if success:
+        size_mb = get("size_bytes", 0) / (1024 * 1024)
+        compression_ratio = get("compression_ratio")
+        lines.append(f"File:      {get('file_path')}")
+        lines.append(f"Size:      {size_mb:.2f} MB")
+        lines.append(f"Duration:  {get('duration_seconds', 0):.2f}s")
+        if compression_ratio:
+            lines.append(f"Compression: {compression_ratio:.1f}x")
+    else:
+        lines.append(f"Error:     {get('error')}")
+    lines.append("-" * 80)
+    return "\n".join(lines) + "\n"
+
+
+@click.command()
+@click.option('--database', default=None, help='Filter by database name')
+@click.option('--limit', default=10, help='Number of recent backups to show')
+def history(database, limit):
+    """View backup history"""
+    
+    records = _metadata_store().get_recent_backups_iter(database, limit)
+
+    first = next(records, None)
+    if first is None:
+        click.echo("No backup history found.")
+        return
+
+    def _blocks():
+        yield "\n" + "=" * 80 + "\nBACKUP HISTORY\n" + "=" * 80
+        for backup in chain([first], records):
+            yield _format_history_record(backup)
+
+    # Stream record blocks through a pager - first output appears
+    # immediately and memory stays flat however large --limit is
+    click.echo_via_pager(_blocks())
@@ -0,0 +1,58 @@
+import click
+from pathlib import Path
+from ..cli import _config, _make_adapter
+
+# Inverse of the _EXT mapping used when backups are written
+# (.sql.gz surfaces as a .gz suffix)
+_SUFFIX_TYPES = {
+    '.dump': 'postgres',
+    '.sql': 'mysql',
+    '.gz': 'mysql',
+    '.archive': 'mongodb',
+}
+
+
+@click.command()
+@click.argument('backup_file', type=click.Path(exists=True, path_type=Path))
+@click.option('--db-type',
+              type=click.Choice(['postgres', 'mysql', 'mongodb'], case_sensitive=False),
+              default=None,
+              help='Database type (default: inferred from the file extension)')
+def list_tables(backup_file, db_type):
+    """
+    List all tables in a backup file
+    
+    Example: python3 -m src.cli list-tables backups/testdb_postgres_backup_20251002_220000.dump
+    """
+    
+    # The extension this tool writes identifies the database type, so a
+    # read-only inspection doesn't need to touch the config at all
+    if not db_type:
+        db_type = _SUFFIX_TYPES.get(backup_file.suffix)
+    if not db_type:
+        db_type = _config(None).get('type', 'postgres')
+    
+    # Create a temporary adapter just for listing
+    temp_params = {
+        'host': 'localhost',
+        'port': 5432 if db_type == 'postgres' else 3306,
+        'user': 'temp',
+        'password': 'temp',
+        'database': 'temp'
+    }
+    adapter = _make_adapter(db_type, temp_params)
+    if adapter is None:
+        raise click.ClickException("Unsupported database type")
+    
+    click.echo(f"\nTables in backup: {backup_file}")
+    click.echo("=" * 60)
+    
+    tables = adapter.list_tables_in_backup(backup_file)
+    
+    if tables:
+        for i, table in enumerate(tables, 1):
+            click.echo(f"{i}. {table}")
+        click.echo("=" * 60)
+        click.echo(f"Total: {len(tables)} tables\n")
+    else:
+        click.echo("No tables found or unable to read backup file\n")
@@ -0,0 +1,89 @@
+import click
+from pathlib import Path
+from ..cli import (_config, _resolve_params, _RESOLVE_KEYS, _make_adapter,
+                   _logger, _slack_notifier, _ensure_connected)
+
+
+@click.command()
+@click.option('--db-type', 
+              type=click.Choice(['postgres','mysql','mongodb'], case_sensitive=False),
+              default=None)
+@click.option('--host', default=None)
+@click.option('--port', type=int, default=None)
+@click.option('--user', default=None)
+@click.option('--password', default=None)
+@click.option('--database', 
+              default=None,
+              help='Target database name')
+@click.option('--input', 
+              'backup_file',
+              type=click.Path(exists=True, path_type=Path),
+              required=True,
+              help='Backup file to restore from')
+@click.option('--confirm',
+              is_flag=True,
+              help='Skip confirmation prompt')
+def restore(db_type, host, port, user, password, database, backup_file, confirm):
+    """Restore a database from backup"""
+    
+    # Load config from .env
+    config = _config(db_type)
+    
+    # Use CLI arguments if provided, otherwise use config
+    resolved = _resolve_params(
+        {'type': db_type, 'host': host, 'port': port, 'user': user,
+         'password': password, 'database': database},
+        config
+    )
+    if resolved is None:
+        raise click.ClickException("Missing required parameters!")
+    db_type, host, port, user, password, database = (
+        resolved[key] for key in _RESOLVE_KEYS
+    )
+    
+    # Log restore start
+    _logger().log_restore_start(database, backup_file)
+    
+    # One echo per banner keeps it to a single stdout write
+    bar = "=" * 60
+    click.echo("\n".join([
+        "\n" + bar,
+        "DATABASE RESTORE TOOL",
+        bar,
+        f"WARNING: This will OVERWRITE database '{database}'!",
+        bar + "\n",
+    ]))
+    
+    if not confirm:
+        click.confirm(
+            f"Are you sure you want to restore to '{database}'?",
+            abort=True
+        )
+    
+    # One dict construction; the conditional spread avoids mutating in a
+    # second step when no port was resolved
+    connection_params = {
+        'host': host,
+        'user': user,
+        'password': password,
+        'database': database,
+        **({'port': port} if port else {})
+    }
+    
+    adapter = _make_adapter(db_type, connection_params)
+    if adapter is None:
+        raise click.ClickException(f"Unsupported database type: {db_type}")
+    
+    _ensure_connected(adapter, database, backup_file=backup_file, op='restore')
+    
+    success = adapter.restore(backup_file, database)
+    
+    if success:
+        _logger().log_restore_success(database, backup_file)
+        _slack_notifier().send_restore_success(database, backup_file)
+        click.echo("\nDatabase restored successfully!")
+    else:
+        _logger().log_restore_failure(database, backup_file, "Restore operation failed")
+        _slack_notifier().send_restore_failure(database, backup_file, "Restore operation failed")
+        click.echo("\nRestore failed!")
+        raise click.exceptions.Exit(1)
@@ -0,0 +1,94 @@
+import click
+from pathlib import Path
+from ..cli import (_config, _resolve_params, _RESOLVE_KEYS, _make_adapter,
+                   _ensure_connected)
+
+
+@click.command()
+@click.option('--db-type', 
+              type=click.Choice(['postgres','mysql','mongodb'], case_sensitive=False),
+              default=None)
+@click.option('--host', default=None)
+@click.option('--port', type=int, default=None)
+@click.option('--user', default=None)
+@click.option('--password', default=None)
+@click.option('--database', 
+              default=None,
+              help='Target database name')
+@click.option('--input', 
+              'backup_file',
+              type=click.Path(exists=True, path_type=Path),
+              required=True,
+              help='Backup file to restore from')
+@click.option('--tables',
+              required=True,
+              help='Comma-separated list of tables to restore (e.g., users,orders)')
+@click.option('--confirm',
+              is_flag=True,
+              help='Skip confirmation prompt')
+def restore_tables(db_type, host, port, user, password, database, backup_file, tables, confirm):
+    """
+    Restore specific tables/collections from a backup
+    
+    For SQL databases: tables
+    For MongoDB: collections
+
+    Example: 
+    python3 -m src.cli restore-tables --input backup.dump --tables users,orders
+    """
+    
+    # Load config
+    config = _config(db_type)
+    
+    # Use CLI arguments if provided, otherwise use config
+    resolved = _resolve_params(
+        {'type': db_type, 'host': host, 'port': port, 'user': user,
+         'password': password, 'database': database},
+        config
+    )
+    if resolved is None:
+        raise click.ClickException("Missing required parameters!")
+    db_type, host, port, user, password, database = (
+        resolved[key] for key in _RESOLVE_KEYS
+    )
+    
+    # Parse tables - single pass, dropping empties from trailing commas
+    table_list = list(filter(None, (t.strip() for t in tables.split(','))))
+    
+    click.echo("\n" + "=" * 60)
+    click.echo("SELECTIVE TABLE RESTORE")
+    click.echo("=" * 60)
+    click.echo(f"WARNING: This will OVERWRITE these tables in '{database}':")
+    for table in table_list:
+        click.echo(f"  - {table}")
+    click.echo("=" * 60 + "\n")
+    
+    if not confirm:
+        click.confirm(
+            f"Are you sure you want to restore these tables?",
+            abort=True
+        )
+    
+    # One dict construction; the conditional spread avoids mutating in a
+    # second step when no port was resolved
+    connection_params = {
+        'host': host,
+        'user': user,
+        'password': password,
+        'database': database,
+        **({'port': port} if port else {})
+    }
+    
+    adapter = _make_adapter(db_type, connection_params)
+    if adapter is None:
+        raise click.ClickException(f"Unsupported database type: {db_type}")
+    
+    _ensure_connected(adapter, database, backup_file=backup_file, op='restore')
+    
+    success = adapter.restore_selective(backup_file, database, table_list)
+    
+    if success:
+        click.echo(f"\nTables restored successfully!")
+    else:
+        click.echo("\nRestore failed!")
+        raise click.exceptions.Exit(1)
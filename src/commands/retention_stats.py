@@ -0,0 +1,25 @@
+import click
+
+
+@click.command()
+def retention_stats():
+    """Show backup retention statistics"""
+    from ..retention import RetentionPolicy
+    
+    policy = RetentionPolicy()
+    stats = policy.get_retention_stats()
+    
+    bar = "=" * 60
+    click.echo("\n".join([
+        "\n" + bar,
+        "BACKUP RETENTION STATISTICS",
+        bar,
+        f"Total backups:  {stats['total_backups']}",
+        f"Total size:     {stats['total_size_gb']:.2f}GB ({stats['total_size_mb']:.1f}MB)",
+        "\nBackups by age:",
+        f"  Last 24 hours: {stats['by_age']['last_day']}",
+        f"  Last week:     {stats['by_age']['last_week']}",
+        f"  Last month:    {stats['by_age']['last_month']}",
+        f"  Older:         {stats['by_age']['older']}",
+        bar,
+    ]))
@@ -0,0 +1,22 @@
+import click
+from ..cli import _metadata_store
+
+
+@click.command()
+def stats():
+    """Show backup statistics"""
+    
+    stats = _metadata_store().get_backup_stats()
+    
+    bar = "=" * 60
+    click.echo("\n".join([
+        "\n" + bar,
+        "BACKUP STATISTICS",
+        bar,
+        f"Total Backups:     {stats['total_backups']}",
+        f"Successful:        {stats['successful']}",
+        f"Failed:            {stats['failed']}",
+        f"Total Storage:     {stats['total_size_mb']:.2f} MB",
+        f"Databases Backed Up: {', '.join(stats.get('databases', []))}",
+        bar + "\n",
+    ]))
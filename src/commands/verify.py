@@ -0,0 +1,55 @@
+import click
+from pathlib import Path
+from ..cli import _verifier, _STYLED_PASS, _STYLED_FAIL, _STYLED_PASSED, _STYLED_FAILED
+
+
+@click.command()
+@click.argument('backup_file', type=click.Path(exists=True, path_type=Path))
+@click.option('--db-type', 
+              type=click.Choice(['postgres','mysql','mongodb'], case_sensitive=False),
+              default='postgres',
+              help='Database type')
+@click.option('--skip-checksum',
+              is_flag=True,
+              help='Skip the checksum pass; only check integrity and format')
+def verify(backup_file, db_type, skip_checksum):
+    """
+    Verify a backup file's integrity and validity
+    
+    Example: python3 -m src.cli verify backups/testdb_postgres_backup_20251002_220000.dump
+    """
+    
+    click.echo(f"\nVerifying backup: {backup_file}")
+    click.echo("=" * 60)
+    
+    results = _verifier().verify_full(backup_file, db_type, skip_checksum=skip_checksum)
+    
+    # Display results
+    click.echo(f"\nDatabase Type: {results['db_type']}")
+    click.echo(f"Verification Time: {results['timestamp']}")
+    
+    if 'checksum' in results:
+        algo = results.get('checksum_algo', 'sha256').upper()
+        click.echo(f"{algo} Checksum: {results['checksum']}")
+    
+    click.echo("\nVerification Checks:")
+    click.echo("-" * 60)
+    
+    lines = []
+    for check_name, check_result in results['checks'].items():
+        status = _STYLED_PASS if check_result['passed'] else _STYLED_FAIL
+
+        lines.append(f"\n{check_name.replace('_', ' ').title()}:")
+        lines.append(f"  Status: {status}")
+        lines.append(f"  {check_result['message']}")
+
+    overall = _STYLED_PASSED if results['overall_status'] == 'PASSED' else _STYLED_FAILED
+    lines.append("\n" + "=" * 60)
+    lines.append(f"Overall Status: {overall}")
+    lines.append(f"Summary: {results['summary']}")
+    lines.append("=" * 60 + "\n")
+    click.echo("\n".join(lines))
+    
+    # Exit with error code if verification failed
+    if results['overall_status'] != 'PASSED':
+        raise click.exceptions.Exit(1)
@@ -0,0 +1,45 @@
+import io
+import click
+from pathlib import Path
+from ..cli import _verifier, _STYLED_PASSED, _STYLED_FAILED
+
+
+@click.command()
+@click.option('--backup-file', 
+              type=click.Path(exists=True, path_type=Path),
+              help='Show history for specific backup file')
+def verify_history(backup_file):
+    """
+    Show verification history
+    
+    Example: python3 -m src.cli verify-history
+    """
+    
+    history = _verifier().get_verification_history(backup_file)
+    
+    if not history:
+        click.echo("No verification history found")
+        return
+    
+    # Six echo calls per report each pay for encoding and a possible
+    # flush; accumulating into one buffer makes the whole listing a
+    # single write - still through click.echo, which strips the styled
+    # status strings when stdout isn't a terminal
+    buf = io.StringIO()
+    buf.write("\nBackup Verification History\n")
+    buf.write("=" * 80 + "\n")
+
+    for report in history:
+        status = _STYLED_PASSED if report['overall_status'] == 'PASSED' else _STYLED_FAILED
+
+        buf.write(f"\nBackup: {report['backup_path']}\n")
+        buf.write(f"Verified: {report['timestamp']}\n")
+        buf.write(f"Status: {status}\n")
+        buf.write(f"Summary: {report['summary']}\n")
+
+        if 'checksum' in report:
+            buf.write(f"Checksum: {report['checksum'][:16]}...\n")
+
+        buf.write("-" * 80 + "\n")
+
+    click.echo(buf.getvalue(), nl=False)
@@ -1,22 +1,40 @@
 import os
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
 from typing import Dict, Optional
 
-load_dotenv()
+_dotenv_loaded = False
+
+
+def _ensure_env():
+    """Parse .env exactly once, and only when config is first read"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        # Imported here so paths that never read config (--help,
+        # --version) don't pay for loading python-dotenv
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
 
 
 class Config:
     """Configuration management with support for multiple database profiles"""
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_database_config(db_type: Optional[str] = None) -> Dict[str, Optional[str]]:
         """
         Get database configuration based on database type.
         
         Reads environment variables like POSTGRES_HOST, MYSQL_HOST, etc.
         Falls back to generic DB_* variables if type-specific ones don't exist.
+
+        Cached per db_type - the environment doesn't change mid-run, so
+        repeated calls skip the os.getenv lookups. Callers must treat
+        the returned dict as read-only.
         """
+        _ensure_env()
+
         if not db_type:
             db_type = os.getenv('DB_TYPE', 'postgres')
         
@@ -39,20 +57,27 @@ class Config:
         return config
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_backup_dir() -> str:
         """Get backup directory from environment or use default"""
+        _ensure_env()
         return os.getenv('BACKUP_DIR', 'backups')
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Drop cached config reads, e.g. after changing the environment"""
+        cls.get_database_config.cache_clear()
+        cls.get_backup_dir.cache_clear()
     
     @staticmethod
     def validate_config(db_type: str) -> bool:
         """Check if required config values are present for db_type"""
         config = Config.get_database_config(db_type)
-        required = ['type', 'host', 'user', 'password', 'database']
-        
-        missing = [key for key in required if not config.get(key)]
-        
-        if missing:
-            print(f"Missing required configuration for {db_type}: {', '.join(missing)}")
-            return False
-        
+
+        # Stop at the first gap - an incomplete config fails either way
+        for key in ('type', 'host', 'user', 'password', 'database'):
+            if not config.get(key):
+                print(f"Missing required configuration for {db_type}: {key}")
+                return False
+
         return True
\ No newline at end of file
@@ -0,0 +1,32 @@
+# src/jsonio.py
+"""
+JSON helpers that use orjson when it is installed.
+
+orjson parses and serialises typical metadata payloads several times
+faster than the stdlib because the whole loop runs in C. It's an
+optional dependency - without it these helpers fall back to the
+stdlib with identical semantics for the types this tool stores.
+"""
+
+try:
+    import orjson
+
+    def loads(data):
+        """Parse JSON from str or bytes"""
+        return orjson.loads(data)
+
+    def dumps(obj, indent: bool = False) -> str:
+        """Serialise obj to a JSON string, optionally pretty-printed"""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+
+except ImportError:
+    import json
+
+    def loads(data):
+        """Parse JSON from str or bytes"""
+        return json.loads(data)
+
+    def dumps(obj, indent: bool = False) -> str:
+        """Serialise obj to a JSON string, optionally pretty-printed"""
+        return json.dumps(obj, indent=2 if indent else None)
@@ -1,7 +1,13 @@
+import atexit
 import logging
+import os
+from logging.handlers import MemoryHandler
+from contextlib import contextmanager
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-import json
+from . import jsonio
 
 
 class BackupLogger:
@@ -9,11 +15,23 @@ class BackupLogger:
     
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(parents=True, exist_ok=True)
         
         # Create logger
         self.logger = logging.getLogger("db_backup")
         self.logger.setLevel(logging.INFO)
+        self._ready = False
+    
+    def _ensure(self):
+        """
+        Create the log directory and handlers on first actual log call.
+
+        Constructing the logger eagerly cost a mkdir and an open file
+        descriptor on every invocation, help screens included.
+        """
+        if self._ready:
+            return
+        self._ready = True
+        self.log_dir.mkdir(parents=True, exist_ok=True)
         
         # Prevent duplicate handlers
         if not self.logger.handlers:
@@ -22,9 +40,12 @@ class BackupLogger:
     def _setup_handlers(self):
         """Setup file and console handlers"""
         
-        # File handler - detailed logs
+        # File handler - detailed logs. Wrapped in a MemoryHandler so
+        # routine records coalesce into batched writes instead of one
+        # syscall per line; errors still flush immediately, and pending
+        # lines go out at exit.
         log_file = self.log_dir / f"backup_{datetime.now().strftime('%Y%m')}.log"
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.FileHandler(log_file, delay=True)
         file_handler.setLevel(logging.INFO)
         
         # Console handler - errors only
@@ -40,11 +61,20 @@ class BackupLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
+        buffered_handler = MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        atexit.register(buffered_handler.flush)
+        
+        self.logger.addHandler(buffered_handler)
         self.logger.addHandler(console_handler)
     
     def log_backup_start(self, database: str, db_type: str, host: str):
         """Log the start of a backup operation"""
+        self._ensure()
         self.logger.info(
             f"BACKUP_START | Database: {database} | Type: {db_type} | Host: {host}"
         )
@@ -52,6 +82,7 @@ class BackupLogger:
     def log_backup_success(self, database: str, file_path: str, size_mb: float, 
                           duration: float, compression_ratio: float = None):
         """Log successful backup completion"""
+        self._ensure()
         msg = (
             f"BACKUP_SUCCESS | Database: {database} | "
             f"File: {file_path} | Size: {size_mb:.2f}MB | "
@@ -64,30 +95,35 @@ class BackupLogger:
     
     def log_backup_failure(self, database: str, error: str):
         """Log backup failure"""
+        self._ensure()
         self.logger.error(
             f"BACKUP_FAILED | Database: {database} | Error: {error}"
         )
     
     def log_restore_start(self, database: str, backup_file: str):
         """Log the start of a restore operation"""
+        self._ensure()
         self.logger.info(
             f"RESTORE_START | Database: {database} | From: {backup_file}"
         )
     
     def log_restore_success(self, database: str, backup_file: str):
         """Log successful restore"""
+        self._ensure()
         self.logger.info(
             f"RESTORE_SUCCESS | Database: {database} | From: {backup_file}"
         )
     
     def log_restore_failure(self, database: str, backup_file: str, error: str):
         """Log restore failure"""
+        self._ensure()
         self.logger.error(
             f"RESTORE_FAILED | Database: {database} | From: {backup_file} | Error: {error}"
         )
     
     def log_connection_test(self, database: str, host: str, success: bool):
         """Log connection test result"""
+        self._ensure()
         status = "SUCCESS" if success else "FAILED"
         level = logging.INFO if success else logging.WARNING
         self.logger.log(
@@ -97,67 +133,264 @@ class BackupLogger:
 
 
 class BackupMetadata:
-    """Store structured backup metadata in JSON format"""
-    
+    """
+    Store structured backup metadata as JSON Lines.
+
+    One record per line means a new backup is a single append instead
+    of a rewrite of the whole history, and readers can parse just the
+    lines they need. Running aggregates live in a small sidecar JSON
+    file so stats stays a constant-time read. A legacy single-document
+    backup_metadata.json is migrated on first use.
+    """
+
     def __init__(self, metadata_dir: str = "logs"):
         self.metadata_dir = Path(metadata_dir)
+        self.metadata_file = self.metadata_dir / "backup_metadata.ndjson"
+        self.aggregates_file = self.metadata_dir / "backup_aggregates.json"
+        self._in_session = False
+        self._session_records = []
+        # Served to repeated history views while the file is unchanged
+        self._recent_cache = {}
+        self._ready = False
+
+    def _ensure(self):
+        """Create the directory and run the legacy migration on first use"""
+        if self._ready:
+            return
+        self._ready = True
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
-        self.metadata_file = self.metadata_dir / "backup_metadata.json"
-        
-        # Load existing metadata or create new
-        self.metadata = self._load_metadata()
-    
-    def _load_metadata(self):
-        """Load existing metadata from file"""
-        if self.metadata_file.exists():
+        self._migrate_legacy()
+
+    @cached_property
+    def aggregates(self):
+        """Running totals, loaded from the sidecar on first access"""
+        self._ensure()
+        return self._load_aggregates()
+
+    def _migrate_legacy(self):
+        """One-time conversion of the old JSON-array metadata file"""
+        legacy_file = self.metadata_dir / "backup_metadata.json"
+        if self.metadata_file.exists() or not legacy_file.exists():
+            return
+        try:
+            with open(legacy_file, 'r') as f:
+                records = jsonio.loads(f.read()).get("backups", [])
+        except ValueError:
+            return
+        self._append_records(records)
+        legacy_file.rename(f"{legacy_file}.bak")
+
+    def _iter_records(self):
+        """Yield every stored record in append (roughly chronological) order"""
+        self._ensure()
+        if not self.metadata_file.exists():
+            return
+        with open(self.metadata_file, 'r') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        yield jsonio.loads(line)
+                    except ValueError:
+                        continue
+
+    def _iter_records_reversed(self):
+        """
+        Yield stored records last-appended-first.
+
+        Reads the file backward in 64 KiB blocks from the end, so
+        callers that only want the newest few records never touch the
+        bulk of a large history.
+        """
+        self._ensure()
+        try:
+            f = open(self.metadata_file, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            remainder = b""
+            while position > 0:
+                read_size = min(1 << 16, position)
+                position -= read_size
+                f.seek(position)
+                block = f.read(read_size) + remainder
+                lines = block.split(b"\n")
+                # The first piece may continue a line from the previous
+                # (earlier) block - hold it back until that block is read
+                remainder = lines.pop(0)
+                for line in reversed(lines):
+                    if line.strip():
+                        try:
+                            yield jsonio.loads(line)
+                        except ValueError:
+                            continue
+            if remainder.strip():
+                try:
+                    yield jsonio.loads(remainder)
+                except ValueError:
+                    pass
+
+    def _append_records(self, records):
+        """Append records as JSON lines with one buffered write and fsync"""
+        if not records:
+            return
+        self._ensure()
+        with open(self.metadata_file, 'a', buffering=1 << 20) as f:
+            for record in records:
+                f.write(jsonio.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _load_aggregates(self):
+        """Load the aggregates sidecar, rebuilding it from history if absent"""
+        if self.aggregates_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return {"backups": []}
-        return {"backups": []}
-    
-    def _save_metadata(self):
-        """Save metadata to file"""
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=2)
-    
+                with open(self.aggregates_file, 'r') as f:
+                    return jsonio.loads(f.read())
+            except ValueError:
+                pass
+        return self._rebuild_aggregates()
+
+    def _save_aggregates(self):
+        """Persist the aggregates sidecar (small, so a rewrite is cheap)"""
+        with open(self.aggregates_file, 'w') as f:
+            f.write(jsonio.dumps(self.aggregates, indent=True))
+
+    def _rebuild_aggregates(self):
+        """
+        Recompute the aggregates from the full history.
+
+        Only needed when the sidecar is missing or unreadable;
+        afterwards the totals are maintained incrementally on write.
+        Generator-fed sum() keeps the per-record work in C rather than
+        interpreter bytecode - it only matters here, on the one path
+        that still scans everything.
+        """
+        records = list(self._iter_records())
+        successful = sum(1 for r in records if r.get("success"))
+        aggregates = {
+            "total_backups": len(records),
+            "successful": successful,
+            "failed": len(records) - successful,
+            "total_size_bytes": sum(
+                r.get("size_bytes", 0) for r in records if r.get("success")
+            ),
+            "databases": list(dict.fromkeys(
+                r["database"] for r in records if r.get("database")
+            ))
+        }
+        self.aggregates = aggregates
+        self._save_aggregates()
+        return aggregates
+
+    def _apply_to_aggregates(self, record: dict):
+        """Fold one record into the running aggregates"""
+        aggregates = self.aggregates
+        aggregates["total_backups"] += 1
+        if record.get("success"):
+            aggregates["successful"] += 1
+            aggregates["total_size_bytes"] += record.get("size_bytes", 0)
+        else:
+            aggregates["failed"] += 1
+
+        database = record.get("database")
+        if database and database not in aggregates["databases"]:
+            aggregates["databases"].append(database)
+
+    @contextmanager
+    def session(self):
+        """
+        Batch several add_backup_record calls into one durable write.
+
+        Inside the with-block, records accumulate in memory; on exit
+        they go out as a single buffered append and one aggregates
+        save. Orchestrations that record many results per run amortise
+        the write cost across all of them.
+        """
+        self._in_session = True
+        try:
+            yield self
+            self._append_records(self._session_records)
+            self._save_aggregates()
+        finally:
+            self._in_session = False
+            self._session_records = []
+
     def add_backup_record(self, record: dict):
-        """Add a backup record to metadata"""
-        self.metadata["backups"].append(record)
-        self._save_metadata()
-    
+        """Add a backup record and fold it into the aggregates"""
+        self._apply_to_aggregates(record)
+        if self._in_session:
+            self._session_records.append(record)
+        else:
+            self._append_records([record])
+            self._save_aggregates()
+
+    def add_backup_records(self, records: list):
+        """Add several records with a single append and aggregates save"""
+        for record in records:
+            self._apply_to_aggregates(record)
+        self._append_records(records)
+        self._save_aggregates()
+
     def get_recent_backups(self, database: str = None, limit: int = 10):
         """Get recent backups, optionally filtered by database"""
-        backups = self.metadata["backups"]
-        
+        return list(self.get_recent_backups_iter(database, limit))
+
+    def get_recent_backups_iter(self, database: str = None, limit: int = 10):
+        """
+        Yield recent backups newest-first, one at a time.
+
+        Records append in chronological order, so the file is read
+        backward from the end and parsing stops once limit matches are
+        found - a history view costs the same on a ten-record file and
+        a hundred-thousand-record one. Repeated views of an unchanged
+        file come from a small mtime-keyed cache.
+        """
+        self._ensure()
+        try:
+            mtime = os.stat(self.metadata_file).st_mtime_ns
+        except OSError:
+            return
+
+        cache_key = (database, limit)
+        cached = self._recent_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            yield from cached[1]
+            return
+
+        records = self._iter_records_reversed()
         if database:
-            backups = [b for b in backups if b.get("database") == database]
-        
-        # Return most recent first
-        return sorted(backups, key=lambda x: x.get("timestamp", ""), reverse=True)[:limit]
-    
+            records = (r for r in records if r.get("database") == database)
+        selected = list(islice(records, limit))
+        # Append order is chronological but not strictly guaranteed;
+        # sorting just the selected few keeps the newest-first contract
+        selected.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+
+        self._recent_cache[cache_key] = (mtime, selected)
+        yield from selected
+
     def get_backup_stats(self):
-        """Get statistics about backups"""
-        backups = self.metadata["backups"]
-        
-        if not backups:
+        """
+        Get statistics about backups.
+
+        Aggregates are maintained incrementally on every write, so this
+        is a constant-time read rather than a scan of the full history.
+        """
+        aggregates = self.aggregates
+
+        if not aggregates["total_backups"]:
             return {
                 "total_backups": 0,
                 "successful": 0,
                 "failed": 0,
                 "total_size_mb": 0
             }
-        
-        successful = [b for b in backups if b.get("success")]
-        failed = [b for b in backups if not b.get("success")]
-        
-        total_size = sum(b.get("size_bytes", 0) for b in successful) / (1024 * 1024)
-        
+
         return {
-            "total_backups": len(backups),
-            "successful": len(successful),
-            "failed": len(failed),
-            "total_size_mb": total_size,
-            "databases": list(set(b.get("database") for b in backups if b.get("database")))
-        }
\ No newline at end of file
+            "total_backups": aggregates["total_backups"],
+            "successful": aggregates["successful"],
+            "failed": aggregates["failed"],
+            "total_size_mb": aggregates["total_size_bytes"] / (1024 * 1024),
+            "databases": list(aggregates["databases"])
+        }
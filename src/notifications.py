@@ -1,7 +1,7 @@
 import os
+import time
+from functools import cached_property
 from typing import Optional
-from slack_sdk.webhook import WebhookClient
-from datetime import datetime
 
 
 class SlackNotifier:
@@ -14,6 +14,27 @@ class SlackNotifier:
         if self.enabled and not self.webhook_url:
             print("Warning: Slack notifications enabled but SLACK_WEBHOOK_URL not set")
             self.enabled = False
+
+    @cached_property
+    def _webhook(self):
+        """
+        One WebhookClient shared by every notification this process sends.
+
+        Building the client per call re-parsed the URL and rebuilt the
+        retry machinery each time; a bounded timeout keeps a slow Slack
+        endpoint from stalling the command, and transient connection
+        errors get two retries with backoff. slack_sdk is imported here,
+        on first actual send - with notifications disabled (the default)
+        the whole SDK stays unloaded.
+        """
+        from slack_sdk.webhook import WebhookClient
+        from slack_sdk.http_retry.builtin_handlers import ConnectionErrorRetryHandler
+
+        return WebhookClient(
+            self.webhook_url,
+            timeout=5,
+            retry_handlers=[ConnectionErrorRetryHandler(max_retry_count=2)]
+        )
     
     def send_backup_success(self, database: str, file_path: str, size_mb: float, 
                            duration: float, compression_ratio: Optional[float] = None):
@@ -58,7 +79,7 @@ class SlackNotifier:
                     "title": "Backup Completed Successfully",
                     "fields": fields,
                     "footer": "Database Backup CLI",
-                    "ts": int(datetime.now().timestamp())
+                    "ts": int(time.time())
                 }
             ]
         }
@@ -88,7 +109,7 @@ class SlackNotifier:
                         }
                     ],
                     "footer": "Database Backup CLI",
-                    "ts": int(datetime.now().timestamp())
+                    "ts": int(time.time())
                 }
             ]
         }
@@ -118,7 +139,7 @@ class SlackNotifier:
                         }
                     ],
                     "footer": "Database Backup CLI",
-                    "ts": int(datetime.now().timestamp())
+                    "ts": int(time.time())
                 }
             ]
         }
@@ -153,7 +174,7 @@ class SlackNotifier:
                         }
                     ],
                     "footer": "Database Backup CLI",
-                    "ts": int(datetime.now().timestamp())
+                    "ts": int(time.time())
                 }
             ]
         }
@@ -162,9 +183,10 @@ class SlackNotifier:
     
     def _send(self, message: dict):
         """Internal method to send message to Slack"""
+        if not self.enabled:
+            return
         try:
-            webhook = WebhookClient(self.webhook_url)
-            response = webhook.send(
+            response = self._webhook.send(
                 text="Database Backup Notification",
                 attachments=message.get("attachments")
             )
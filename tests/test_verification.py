@@ -0,0 +1,22 @@
+from src.verification import BackupVerifier
+
+
+def _write_dump(path):
+    path.write_text(
+        "--\n-- PostgreSQL database dump\n--\n" + "CREATE TABLE t (x int);\n" * 50
+    )
+
+
+def test_history_filter_accepts_path_objects(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    backup = tmp_path / "app_postgres_backup_20260827_120000.dump"
+    _write_dump(backup)
+
+    verifier = BackupVerifier()
+    results = verifier.verify_full(str(backup), 'postgres')
+    assert results['overall_status'] == 'PASSED'
+
+    # The verify-history command passes a pathlib.Path while the saved
+    # reports hold plain strings - both spellings must find the report
+    assert verifier.get_verification_history(backup)
+    assert verifier.get_verification_history(str(backup))